@@ -88,6 +88,9 @@ class Contributor(object):
     # "Patch" represent all the revisions for which this contributor
     # contributed a patch.
     self.activities = { }
+    # Total number of entries across all lists in self.activities,
+    # kept up to date by add_activity() so that score() is cheap.
+    self.activity_count = 0
     self.interactions = set()
 
   def add_aliases(self, alias):
@@ -101,8 +104,11 @@ class Contributor(object):
     if not logs:
       logs = [ ]
       self.activities[field.name] = logs
-    if not log in logs:
+    # graze() records every activity for one log message before moving
+    # on to the next, so a repeat of LOG can only be the last entry.
+    if not logs or logs[-1] is not log:
       logs.append(log)
+      self.activity_count += 1
 
   def add_collaboration(self, field):
     for c in field.contributors:
@@ -139,10 +145,7 @@ class Contributor(object):
   def score(self):
     """Return a contribution score for this contributor."""
     # Right now we count both patches and reviews as 1
-    score = 0
-    for activity in self.activities.keys():
-      score += len(self.activities[activity])
-    return score
+    return self.activity_count
 
   def score_str(self):
     """Return a contribution score HTML string for this contributor."""
@@ -337,7 +340,7 @@ class Contributor(object):
       out.write('<pre>\n')
       sha = '<a href="https://github.com/apache/cassandra/commit/%s">%s</a>' % (log.sha, log.sha)
       out.write('<b>%s | %s | %s</b>\n\n' % (sha, escape_html(log.author), log.date))
-      out.write(spam_guard_in_html_block(re.sub(r'for CASSANDRA-([0-9]+)', r'for <a href="https://issues.apache.org/jira/browse/CASSANDRA-\1">CASSANDRA-\1</a>', escape_html(log.message))))
+      out.write(spam_guard_in_html_block(_jira_link_re.sub(r'for <a href="https://issues.apache.org/jira/browse/CASSANDRA-\1">CASSANDRA-\1</a>', escape_html(log.message))))
       out.write('</pre>\n')
       out.write('</div>\n\n')
     out.write('<hr />\n')
@@ -454,6 +457,7 @@ log_header_re = re.compile('^commit ([0-9a-z]+)$')
 patch_by_re = re.compile('(?:.*\n)*.*patch by ([^;]+)(;|,)', flags=re.IGNORECASE | re.MULTILINE)
 reviewed_by_re = re.compile('(?:.*\n)*.*[;, ](?:review|test)(?:ed)? by ((?:.|\n)+?)(?=(?: |\n)+for(?: |\n)+(?:cassandra-|#[0-9]+))', flags=re.IGNORECASE | re.MULTILINE)
 coauthored_by_re = re.compile(' *co-authored-by: ([^<]+)', re.IGNORECASE)
+names_split_re = re.compile(',|&|( |\n)and( |\n)(by( |\n))?')
 
 def graze(input):
   line = input.readline()
@@ -480,7 +484,7 @@ def graze(input):
         if m: 
             m = patch_by_re.match(log.message)
             if m:
-                authors = re.split(',|&|( |\n)and( |\n)(by( |\n))?', m.group(1))
+                authors = names_split_re.split(m.group(1))
                 for author in authors:
                     if author and not author.isspace():
                         c = Contributor.get(" ".join(author.strip().split()), None)
@@ -489,7 +493,7 @@ def graze(input):
                 log.add_field(patch_field)
             m = reviewed_by_re.match(log.message)
             if m:
-                reviewers = re.split(',|&|( |\n)and( |\n)(by( |\n))?', m.group(1))
+                reviewers = names_split_re.split(m.group(1))
                 for reviewer in reviewers:
                     if reviewer and not reviewer.isspace():
                         c = Contributor.get(" ".join(reviewer.strip().split()), None)
@@ -537,6 +541,8 @@ def escape_html(str):
   """Return an HTML-escaped version of STR."""
   return str.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
 
+_jira_link_re = re.compile(r'for CASSANDRA-([0-9]+)')
+
 _spam_guard_in_html_block_re = re.compile(r'&lt;([^&]*@[^&]*)&gt;')
 def _spam_guard_in_html_block_func(m):
   return "&lt;%s&gt;" % html_spam_guard(m.group(1))
@@ -578,14 +584,11 @@ def drop(title):
   # The data structures are all linked up nicely to one another.  You
   # can get all the LogMessages, and each LogMessage contains all the
   # Contributors involved with that commit; likewise, each Contributor
-  # points back to all the LogMessages it contributed to.
+  # points back to all the LogMessages it contributed to.  (You could
+  # print out all log messages by walking LogMessage.all_logs, if you
+  # wanted to.)
   #
 
-  for key in LogMessage.all_logs.keys():
-    # You could print out all log messages this way, if you wanted to.
-    pass
-    #print(LogMessage.all_logs[key])
-
   detail_subdir = "detail"
   if not os.path.exists(detail_subdir):
     os.mkdir(detail_subdir)
@@ -605,8 +608,9 @@ def drop(title):
                                reverse=True)
   for c in sorted_contributors:
     if c not in seen_contributors:
-      urlpath = "%s/%s.html" % (detail_subdir, c.canonical_name())
-      fname = os.path.join(detail_subdir, "%s.html" % c.canonical_name())
+      canonical_name = c.canonical_name()
+      urlpath = "%s/%s.html" % (detail_subdir, canonical_name)
+      fname = os.path.join(detail_subdir, "%s.html" % canonical_name)
       if c.score() > 0:
         # Don't even bother to print out full committers.  They are
         # a distraction from the purposes for which we're here.